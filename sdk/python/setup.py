@@ -1,8 +1,25 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
 
+# Opt-in: PRIMIS_COMPILE=1 compiles the hot request-dispatch modules
+# with mypyc for a 2-4x cut in per-call Python overhead. Any failure
+# (mypyc missing, no compiler) falls back to the pure-Python install.
+ext_modules = []
+if os.environ.get("PRIMIS_COMPILE") == "1":
+    try:
+        from mypyc.build import mypycify
+
+        ext_modules = mypycify([
+            "src/primis/client.py",
+            "src/primis/exceptions.py",
+        ])
+    except Exception:
+        ext_modules = []
+
 setup(
     name="primis-sdk",
     version="0.1.0",
@@ -14,6 +31,7 @@ setup(
     url="https://github.com/primis-protocol/sdk-python",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -33,6 +51,13 @@ setup(
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9",
+            "brotli>=1.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -3,17 +3,29 @@ Primis SDK - Official Python SDK for Primis Protocol
 
 Example:
     >>> from primis import Primis
-    >>> 
+    >>>
     >>> client = Primis(api_key="prmis_xxx")
-    >>> 
+    >>>
     >>> # Generate an image
     >>> job = client.images.generate(prompt="A futuristic city")
     >>> result = client.images.wait_for_job(job["id"])
     >>> print(result["images"])
 """
 
-from .client import Primis
 from .exceptions import PrimisError, PrimisAPIError, PrimisTimeoutError
 
 __version__ = "0.1.0"
-__all__ = ["Primis", "PrimisError", "PrimisAPIError", "PrimisTimeoutError"]
+__all__ = ["Primis", "AsyncPrimis", "PrimisError", "PrimisAPIError", "PrimisTimeoutError"]
+
+
+def __getattr__(name):
+    # PEP 562: defer importing the client (and transitively requests,
+    # urllib3, ssl, ...) until Primis is actually referenced, keeping
+    # `import primis` fast for short-lived CLI processes.
+    if name == "Primis":
+        from .client import Primis
+        return Primis
+    if name == "AsyncPrimis":
+        from .async_client import AsyncPrimis
+        return AsyncPrimis
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
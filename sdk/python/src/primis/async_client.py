@@ -0,0 +1,400 @@
+"""
+Primis SDK Async Client - asyncio mirror of the synchronous client.
+
+Built on httpx.AsyncClient so many jobs can be awaited concurrently on
+one event loop (and one connection pool) instead of sleeping in
+sequence. Requires the 'http2' extra: pip install primis-sdk[http2]
+
+Example:
+    >>> import asyncio
+    >>> from primis.async_client import AsyncPrimis
+    >>>
+    >>> async def main():
+    ...     async with AsyncPrimis(api_key="prmis_xxx") as client:
+    ...         jobs = [await client.images.generate(prompt=p) for p in prompts]
+    ...         results = await asyncio.gather(
+    ...             *[client.images.wait_for_job(j["id"]) for j in jobs]
+    ...         )
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from .client import GpuInstance, ImageJob, StorageInfo
+from .exceptions import (
+    PrimisError,
+    PrimisAPIError,
+    PrimisTimeoutError,
+    PrimisAuthError,
+    PrimisRateLimitError,
+)
+
+
+# HTTP Client
+class AsyncHttpClient:
+    """Low-level async HTTP client for making API requests."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:3001",
+        timeout: int = 30,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise PrimisError(
+                "The async client requires httpx. Install with: pip install primis-sdk[http2]",
+                "MISSING_DEPENDENCY",
+            )
+
+        if not api_key.startswith("prmis_"):
+            raise PrimisError("Invalid API key format. Keys must start with 'prmis_'")
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make an HTTP request to the API."""
+        try:
+            response = await self._client.request(
+                method,
+                path,
+                json=json,
+                params=params,
+            )
+        except self._httpx.TimeoutException:
+            raise PrimisTimeoutError(f"Request to {path} timed out")
+        except self._httpx.ConnectError as e:
+            raise PrimisError(f"Connection error: {e}", "CONNECTION_ERROR")
+
+        # Parse response
+        try:
+            data = response.json()
+        except ValueError:
+            raise PrimisError(f"Invalid JSON response from {path}", "PARSE_ERROR")
+
+        # Handle errors
+        if response.status_code >= 400:
+            error_msg = data.get("error", f"HTTP {response.status_code}")
+            error_code = data.get("code", "HTTP_ERROR")
+
+            if response.status_code == 401:
+                raise PrimisAuthError(error_msg)
+            elif response.status_code == 429:
+                try:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                except (TypeError, ValueError):
+                    retry_after = 60
+                raise PrimisRateLimitError(error_msg, retry_after)
+            else:
+                raise PrimisAPIError(error_msg, error_code, response.status_code)
+
+        return data
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self.request("GET", path, params=params)
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self.request("POST", path, json=json)
+
+    async def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self.request("PATCH", path, json=json)
+
+    async def delete(self, path: str) -> Dict[str, Any]:
+        return await self.request("DELETE", path)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+
+# Resource Classes
+class AsyncFilesResource:
+    """Files API - Upload, list, and manage files."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def list(self) -> Dict[str, Any]:
+        """List all files for the authenticated user."""
+        return await self._client.get("/api/files")
+
+    async def get_usage(self) -> StorageInfo:
+        """Get storage usage statistics."""
+        response = await self._client.get("/api/files/usage")
+        return response.get("storage", {})
+
+    async def delete(self, folder: str, filename: str) -> None:
+        """Delete a file."""
+        await self._client.delete(f"/api/files/{folder}/{filename}")
+
+
+class AsyncImagesResource:
+    """Images API - Generate images using SDXL."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def estimate(
+        self,
+        prompt: str,
+        num_images: int = 1,
+        width: int = 1024,
+        height: int = 1024,
+        steps: int = 30,
+    ) -> Dict[str, Any]:
+        """Estimate the cost of generating images."""
+        return await self._client.post("/api/batch/estimate", {
+            "prompt": prompt,
+            "numImages": num_images,
+            "width": width,
+            "height": height,
+            "steps": steps,
+        })
+
+    async def generate(
+        self,
+        prompt: str,
+        negative_prompt: Optional[str] = None,
+        num_images: int = 1,
+        width: int = 1024,
+        height: int = 1024,
+        steps: int = 30,
+        guidance_scale: float = 7.5,
+        seed: Optional[int] = None,
+    ) -> ImageJob:
+        """Generate images from a prompt."""
+        payload = {
+            "prompt": prompt,
+            "numImages": num_images,
+            "width": width,
+            "height": height,
+            "steps": steps,
+            "guidanceScale": guidance_scale,
+        }
+        if negative_prompt:
+            payload["negativePrompt"] = negative_prompt
+        if seed is not None:
+            payload["seed"] = seed
+
+        response = await self._client.post("/api/batch/generate", payload)
+        return response.get("job", response)
+
+    async def get_job(self, job_id: str) -> ImageJob:
+        """Get the status of an image generation job."""
+        response = await self._client.get(f"/api/batch/jobs/{job_id}")
+        return response.get("job", response)
+
+    async def list_jobs(self) -> List[ImageJob]:
+        """List all image generation jobs."""
+        response = await self._client.get("/api/batch/jobs")
+        return response.get("jobs", [])
+
+    async def wait_for_job(
+        self,
+        job_id: str,
+        poll_interval: float = 2.0,
+        max_wait: float = 300.0,
+    ) -> ImageJob:
+        """
+        Wait for a job to complete (polling).
+
+        Uses the same exponential backoff with jitter as the sync client,
+        but awaits the sleep so many jobs can be gathered concurrently.
+
+        Args:
+            job_id: The ID of the job to wait for
+            poll_interval: Initial seconds between status checks
+            max_wait: Maximum seconds to wait before timing out
+
+        Returns:
+            The completed ImageJob
+
+        Raises:
+            PrimisTimeoutError: If the job doesn't complete in time
+        """
+        start_time = time.time()
+        interval = poll_interval
+
+        while time.time() - start_time < max_wait:
+            job = await self.get_job(job_id)
+
+            if job["status"] in ("completed", "failed"):
+                return job
+
+            retry_after = job.get("retryAfter")
+            if retry_after is not None:
+                try:
+                    sleep_for = max(float(retry_after), 0.0)
+                except (TypeError, ValueError):
+                    sleep_for = interval
+            else:
+                sleep_for = interval + random.uniform(0, 0.25 * interval)
+                interval = min(interval * 1.5, 15.0)
+
+            # Never sleep past the max_wait budget, whatever the server
+            # hinted; the loop condition settles the timeout.
+            sleep_for = min(sleep_for, max(max_wait - (time.time() - start_time), 0.0))
+            await asyncio.sleep(sleep_for)
+
+        raise PrimisTimeoutError(f"Job {job_id} timed out after {max_wait}s")
+
+
+class AsyncTextResource:
+    """Text API - Generate text using Llama models."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def estimate(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        model: str = "llama8b",
+    ) -> Dict[str, Any]:
+        """Estimate the cost of text generation."""
+        return await self._client.post("/api/inference/text/estimate", {
+            "prompt": prompt,
+            "maxTokens": max_tokens,
+            "model": model,
+        })
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        model: str = "llama8b",
+    ) -> Dict[str, Any]:
+        """Generate text from a prompt."""
+        return await self._client.post("/api/inference/text/generate", {
+            "prompt": prompt,
+            "maxTokens": max_tokens,
+            "temperature": temperature,
+            "model": model,
+        })
+
+
+class AsyncInstancesResource:
+    """Instances API - Launch and manage GPU instances."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def list(self) -> List[GpuInstance]:
+        """List all GPU instances."""
+        response = await self._client.get("/api/instances")
+        return response.get("instances", [])
+
+    async def get_gpu_types(self) -> List[Dict[str, Any]]:
+        """Get available GPU types and pricing."""
+        response = await self._client.get("/api/instances/gpus")
+        return response.get("gpus", [])
+
+    async def launch(
+        self,
+        gpu_type: str,
+        name: Optional[str] = None,
+        docker_image: Optional[str] = None,
+        volume_size: Optional[int] = None,
+    ) -> GpuInstance:
+        """Launch a new GPU instance."""
+        payload = {"gpuType": gpu_type}
+        if name:
+            payload["name"] = name
+        if docker_image:
+            payload["dockerImage"] = docker_image
+        if volume_size:
+            payload["volumeSize"] = volume_size
+
+        response = await self._client.post("/api/instances/launch", payload)
+        return response.get("instance", response)
+
+    async def stop(self, instance_id: str) -> None:
+        """Stop an instance."""
+        await self._client.post(f"/api/instances/{instance_id}/stop")
+
+    async def terminate(self, instance_id: str) -> None:
+        """Terminate an instance."""
+        await self._client.delete(f"/api/instances/{instance_id}")
+
+
+class AsyncApiKeysResource:
+    """API Keys API - Manage API keys."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """List all API keys."""
+        response = await self._client.get("/api/api-keys")
+        return response.get("keys", [])
+
+
+# Main Client
+class AsyncPrimis:
+    """
+    Primis SDK Async Client - asyncio entry point for the Primis API.
+
+    All resources share one AsyncClient connection pool; close it with
+    aclose() or use the client as an async context manager.
+
+    Args:
+        api_key: Your Primis API key (starts with 'prmis_')
+        base_url: API base URL (default: http://localhost:3001)
+        timeout: Request timeout in seconds (default: 30)
+
+    Example:
+        >>> async with AsyncPrimis(api_key="prmis_xxx") as client:
+        ...     files = await client.files.list()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:3001",
+        timeout: int = 30,
+    ):
+        self._client = AsyncHttpClient(api_key, base_url, timeout)
+
+        # Resource namespaces
+        self.files = AsyncFilesResource(self._client)
+        self.images = AsyncImagesResource(self._client)
+        self.text = AsyncTextResource(self._client)
+        self.instances = AsyncInstancesResource(self._client)
+        self.api_keys = AsyncApiKeysResource(self._client)
+
+    @property
+    def base_url(self) -> str:
+        """Get the API base URL."""
+        return self._client.base_url
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPrimis":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
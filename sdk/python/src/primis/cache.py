@@ -0,0 +1,90 @@
+"""On-disk response cache for the Primis SDK.
+
+Persists API responses in SQLite, keyed by a SHA-256 hash of the full
+request (method, path, params, body). Used by HttpClient when a
+cache_mode other than 'disabled' is selected, so repeated runs of the
+same prompts during development replay stored results instead of
+paying for inference again.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+#: Accepted values for ``Primis(cache_mode=...)``.
+#:
+#: - ``enabled``: read hits, write misses
+#: - ``readonly``: read hits, never write
+#: - ``replay``: read hits, raise on miss or non-cacheable request
+#:   (never touches the network)
+#: - ``writeonly``: always hit the network, record responses
+#: - ``disabled``: no disk cache at all
+CACHE_MODES = ("enabled", "readonly", "replay", "writeonly", "disabled")
+
+_DEFAULT_CACHE_PATH = os.path.join("~", ".primis", "cache.db")
+
+
+class PrimisCache:
+    """Content-addressed SQLite store of API responses."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = os.path.expanduser(path or _DEFAULT_CACHE_PATH)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB, status INT, ts INT)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+    ) -> str:
+        """Hash the full request into a stable cache key."""
+        raw = b"|".join([
+            method.encode(),
+            path.encode(),
+            json.dumps(params or {}, sort_keys=True).encode(),
+            json.dumps(body or {}, sort_keys=True).encode(),
+        ])
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response body for key, or None on miss."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, key: str, data: Dict[str, Any], status: int = 200) -> None:
+        """Store a response body under key, replacing any existing entry."""
+        body = json.dumps(data).encode()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, body, status, ts) "
+                "VALUES (?, ?, ?, ?)",
+                (key, body, status, int(time.time())),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -8,10 +8,30 @@ Example:
     >>> files = client.files.list()
 """
 
+import copy
+import gzip
+import json as _json
+import random
+import threading
 import time
-from typing import Any, Dict, List, Optional, TypedDict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# orjson decodes the list-heavy payloads these endpoints return several
+# times faster than stdlib json; optional via the 'fast' extra.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = _json.loads
+    _dumps = None
+
+from .cache import CACHE_MODES, PrimisCache
 from .exceptions import (
     PrimisError,
     PrimisAPIError,
@@ -21,7 +41,8 @@ from .exceptions import (
 )
 
 
-# Type definitions
+# Type definitions. TypedDicts are static hints only — responses stay
+# the raw dicts the API returned, with no runtime wrapping or copying.
 class FileInfo(TypedDict):
     name: str
     path: str
@@ -62,27 +83,121 @@ class GpuInstance(TypedDict):
     sshPort: Optional[int]
 
 
+# Per-path TTLs (seconds) for the GET cache. Slow-changing endpoints
+# (GPU catalog) cache longer than fast-moving ones (job lists). Paths
+# not listed here (e.g. individual job status) are never cached.
+_DEFAULT_CACHE_TTL = 0.0
+_CACHE_POLICY: Dict[str, float] = {
+    "/api/instances/gpus": 60.0,
+    "/api/files": 10.0,
+    "/api/files/usage": 10.0,
+    "/api/api-keys": 30.0,
+    "/api/batch/jobs": 2.0,
+    "/api/instances": 5.0,
+}
+
+# Sentinel returned by HttpClient.request on a 304 so the caller can
+# serve its cached copy without a JSON body ever crossing the wire.
+_NOT_MODIFIED: Dict[str, Any] = {}
+
+# Max memoized estimate results per resource (LRU eviction beyond this).
+_ESTIMATE_CACHE_SIZE = 128
+
+# Compress request bodies larger than one MTU; below that gzip only
+# adds CPU without saving a packet.
+_GZIP_THRESHOLD = 1400
+
+# Required prefix for Primis API keys.
+_KEY_PREFIX = "prmis_"
+
+# Only advertise encodings urllib3 can actually decode here: br needs
+# a brotli backend (shipped in the 'fast' extra), gzip is stdlib.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip"
+
+
 # HTTP Client
 class HttpClient:
     """Low-level HTTP client for making API requests."""
-    
+
     def __init__(
         self,
         api_key: str,
         base_url: str = "http://localhost:3001",
         timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 50,
+        max_retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        requests_per_minute: int = 600,
+        cache_mode: str = "disabled",
+        cache_path: Optional[str] = None,
     ):
-        if not api_key.startswith("prmis_"):
-            raise PrimisError("Invalid API key format. Keys must start with 'prmis_'")
-        
+        if not api_key.startswith(_KEY_PREFIX):
+            raise PrimisError(f"Invalid API key format. Keys must start with '{_KEY_PREFIX}'")
+        if cache_mode not in CACHE_MODES:
+            raise PrimisError(
+                f"Invalid cache_mode {cache_mode!r}. Expected one of {CACHE_MODES}"
+            )
+
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        # Token bucket smoothing bursts below the server's rate limit,
+        # so we don't pay a round-trip just to learn we were too fast.
+        self.requests_per_minute = requests_per_minute
+        self._bucket_tokens = float(max(requests_per_minute, 1))
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+        # Optional persistent response cache for dev/replay workflows.
+        self.cache_mode = cache_mode
+        self._disk_cache: Optional[PrimisCache] = None
+        if cache_mode != "disabled":
+            self._disk_cache = PrimisCache(cache_path)
+        # GET cache: (path, sorted params) -> (expiry, data, etag, last_modified)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any], Optional[str], Optional[str]]] = {}
         self.session = requests.Session()
+        # Content-Type is set per-request only when a body is sent, so
+        # GET/DELETE don't advertise a JSON body they don't carry.
         self.session.headers.update({
             "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
         })
+
+        # Retry transient failures (connection blips, 429/5xx) at the
+        # transport level with exponential backoff. POST is deliberately
+        # excluded so a retried generate() can't submit a job twice.
+        # Retry-After stays Python-level (_handle_response guards
+        # malformed values); urllib3's own header parsing raises
+        # InvalidHeader on garbage before that guard could run.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "PATCH", "DELETE"]),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+
+        # Tune the connection pool so concurrent calls (threaded polling,
+        # batch generation) reuse keep-alive connections instead of paying
+        # a new TCP+TLS handshake each time.
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def request(
         self,
@@ -90,46 +205,284 @@ class HttpClient:
         path: str,
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make an HTTP request to the API."""
+        return self._request(method, path, json=json, params=params, headers=headers)[0]
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """Make a request and also return the response's cache validators.
+
+        Returns ``(data, etag, last_modified)``; the validators are None
+        when the response carried none or was served from the disk cache.
+        """
+        cache_key = None
+        if self._disk_cache is not None:
+            if self._cacheable(method, path, json):
+                cache_key = PrimisCache.make_key(method, path, params, json)
+                if self.cache_mode in ("enabled", "readonly", "replay"):
+                    hit = self._disk_cache.get(cache_key)
+                    if hit is not None:
+                        return hit, None, None
+                    if self.cache_mode == "replay":
+                        raise PrimisError(
+                            f"No cached response for {method} {path} in replay mode",
+                            "CACHE_MISS",
+                        )
+            elif self.cache_mode == "replay":
+                # Replay promises no network — and non-cacheable calls
+                # are exactly the ones that would pay for inference.
+                raise PrimisError(
+                    f"{method} {path} is not replayable in replay mode "
+                    "(non-deterministic request)",
+                    "CACHE_MISS",
+                )
+
+        self._throttle()
+        response = self._send(method, path, json=json, params=params, headers=headers)
+        data, etag, last_modified = self._handle_response(response, path)
+
+        if (
+            cache_key is not None
+            and data is not _NOT_MODIFIED
+            and self.cache_mode in ("enabled", "writeonly")
+        ):
+            self._disk_cache.put(cache_key, data)
+        return data, etag, last_modified
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Issue the raw HTTP call. Subclasses override the transport."""
         url = f"{self.base_url}{path}"
-        
+
+        # Pre-serialize the body (orjson when installed) so requests
+        # doesn't re-run stdlib json.dumps per call.
+        body = None
+        if json is not None:
+            body = _dumps(json) if _dumps is not None else _json.dumps(json).encode()
+            json = None
+            headers = dict(headers or {})
+            headers["Content-Type"] = "application/json"
+            # Text-heavy JSON compresses 3-8x; level 1 keeps CPU cost low.
+            if len(body) > _GZIP_THRESHOLD:
+                body = gzip.compress(body, compresslevel=1)
+                headers["Content-Encoding"] = "gzip"
+
         try:
-            response = self.session.request(
+            return self.session.request(
                 method=method,
                 url=url,
                 json=json,
+                data=body,
                 params=params,
+                headers=headers,
                 timeout=self.timeout,
             )
         except requests.Timeout:
             raise PrimisTimeoutError(f"Request to {path} timed out")
         except requests.ConnectionError as e:
             raise PrimisError(f"Connection error: {e}", "CONNECTION_ERROR")
-        
-        # Parse response
+        except requests.RequestException as e:
+            # Anything else the transport stack raises (invalid headers,
+            # too many redirects, ...) must not escape the SDK contract.
+            raise PrimisError(f"Request to {path} failed: {e}", "REQUEST_ERROR")
+
+    @staticmethod
+    def _cacheable(method: str, path: str, json: Optional[Dict[str, Any]]) -> bool:
+        """Whether a request is safe to serve from the disk cache.
+
+        GETs are, except job status: the disk cache has no TTL, and
+        replaying a stored "processing" payload would freeze
+        wait_for_job at whatever state the first poll saw. Estimate
+        POSTs are deterministic server-side, and text generation is
+        reproducible when pinned with a seed at temperature 0.
+        """
+        if method == "GET":
+            return not path.startswith("/api/batch/jobs")
+        if method == "POST":
+            if path.endswith("/estimate"):
+                return True
+            if path == "/api/inference/text/generate":
+                return (
+                    json is not None
+                    and json.get("seed") is not None
+                    and json.get("temperature") == 0
+                )
+        return False
+
+    def _throttle(self) -> None:
+        """Block until the token bucket grants a request slot."""
+        rpm = self.requests_per_minute
+        if rpm <= 0:
+            return
+
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                # _last_refill sits in the future after a server 429;
+                # no tokens accrue until the penalty window passes.
+                if now > self._last_refill:
+                    self._bucket_tokens = min(
+                        float(rpm),
+                        self._bucket_tokens + (now - self._last_refill) * rpm / 60.0,
+                    )
+                    self._last_refill = now
+                if self._bucket_tokens >= 1.0:
+                    self._bucket_tokens -= 1.0
+                    return
+                wait = max(self._last_refill - now, 0.0)
+                wait += (1.0 - self._bucket_tokens) * 60.0 / rpm
+            time.sleep(wait)
+
+    def _penalize(self, retry_after: float) -> None:
+        """Drain the bucket after a 429 that escaped local throttling."""
+        with self._bucket_lock:
+            self._bucket_tokens = 0.0
+            self._last_refill = time.monotonic() + retry_after
+
+    def _handle_response(
+        self, response: Any, path: str
+    ) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """Parse a raw response and map error statuses to SDK exceptions.
+
+        Returns ``(data, etag, last_modified)`` so the caller can pair
+        the body with its own validators — no shared mutable state that
+        concurrent requests could interleave. Works for both
+        ``requests`` and ``httpx`` responses, which share the
+        ``status_code``/``headers``/``content`` surface used here.
+        """
+        status = response.status_code
+
+        # A 304 has no body; let the caller reuse its cached copy.
+        if status == 304:
+            return _NOT_MODIFIED, None, None
+
+        # Parse response (orjson.JSONDecodeError subclasses ValueError)
         try:
-            data = response.json()
+            data = _loads(response.content)
         except ValueError:
             raise PrimisError(f"Invalid JSON response from {path}", "PARSE_ERROR")
-        
-        # Handle errors
-        if not response.ok:
-            error_msg = data.get("error", f"HTTP {response.status_code}")
-            error_code = data.get("code", "HTTP_ERROR")
-            
-            if response.status_code == 401:
-                raise PrimisAuthError(error_msg)
-            elif response.status_code == 429:
+
+        # Success first: the common path returns without touching the
+        # error-shaped fields at all.
+        if status < 400:
+            return data, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+        error_msg = data.get("error", f"HTTP {status}")
+        error_code = data.get("code", "HTTP_ERROR")
+
+        if status == 401:
+            raise PrimisAuthError(error_msg)
+        if status == 429:
+            try:
                 retry_after = int(response.headers.get("Retry-After", 60))
-                raise PrimisRateLimitError(error_msg, retry_after)
-            else:
-                raise PrimisAPIError(error_msg, error_code, response.status_code)
-        
-        return data
-    
+            except (TypeError, ValueError):
+                retry_after = 60
+            self._penalize(retry_after)
+            raise PrimisRateLimitError(error_msg, retry_after)
+        raise PrimisAPIError(error_msg, error_code, status)
+
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        return self.request("GET", path, params=params)
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            # Deep-copy so callers can mutate the result safely.
+            return copy.deepcopy(cached[1])
+
+        # Stale entry: revalidate with conditional headers so an unchanged
+        # payload comes back as a bodyless 304 instead of a full response.
+        headers: Optional[Dict[str, str]] = None
+        if cached is not None:
+            headers = {}
+            if cached[2]:
+                headers["If-None-Match"] = cached[2]
+            if cached[3]:
+                headers["If-Modified-Since"] = cached[3]
+            headers = headers or None
+
+        data, etag, last_modified = self._request("GET", path, params=params, headers=headers)
+
+        ttl = self.cache_ttl
+        if ttl is None:
+            ttl = _CACHE_POLICY.get(path, _DEFAULT_CACHE_TTL)
+
+        if data is _NOT_MODIFIED and cached is not None:
+            # Server confirmed the cached body is still current.
+            self._cache[key] = (time.monotonic() + max(ttl, 0), cached[1], cached[2], cached[3])
+            return copy.deepcopy(cached[1])
+
+        if ttl > 0:
+            self._cache[key] = (
+                time.monotonic() + ttl,
+                copy.deepcopy(data),
+                etag,
+                last_modified,
+            )
+        return data
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        self._cache.clear()
+
+    def warmup(self) -> None:
+        """Prime the connection pool with a background HEAD request.
+
+        Hides the first request's TCP+TLS handshake behind user-side
+        setup. The probe goes through _send so it primes whichever
+        transport real traffic will use (requests pool or httpx HTTP/2
+        connection). Best-effort only: failures are swallowed, and the
+        probe doesn't authenticate — a bad key still surfaces on the
+        first real call.
+        """
+        def _prime() -> None:
+            try:
+                self._send("HEAD", "/api/health")
+            except Exception:
+                pass
+
+        threading.Thread(target=_prime, daemon=True).start()
+
+    def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        read_timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Open a streaming GET and return the raw response.
+
+        Args:
+            path: API path to stream from
+            params: Optional query parameters
+            read_timeout: Longest a read may block waiting for the next
+                server push; None waits indefinitely. Callers with a
+                wait budget should pass it here so a silent server
+                can't hang them forever.
+        """
+        url = f"{self.base_url}{path}"
+        try:
+            return self.session.get(
+                url,
+                params=params,
+                stream=True,
+                timeout=(self.timeout, read_timeout),
+            )
+        except requests.Timeout:
+            raise PrimisTimeoutError(f"Request to {path} timed out")
+        except requests.ConnectionError as e:
+            raise PrimisError(f"Connection error: {e}", "CONNECTION_ERROR")
     
     def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return self.request("POST", path, json=json)
@@ -141,6 +494,101 @@ class HttpClient:
         return self.request("DELETE", path)
 
 
+class Http2Client(HttpClient):
+    """HttpClient variant backed by httpx with HTTP/2 multiplexing.
+
+    Concurrent requests share a single TLS connection via stream
+    multiplexing instead of queueing on HTTP/1.1 keep-alive sockets.
+    Requires the ``http2`` extra: ``pip install primis-sdk[http2]``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:3001",
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 50,
+        max_retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        requests_per_minute: int = 600,
+        cache_mode: str = "disabled",
+        cache_path: Optional[str] = None,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise PrimisError(
+                "HTTP/2 support requires httpx. Install with: pip install primis-sdk[http2]",
+                "MISSING_DEPENDENCY",
+            )
+
+        super().__init__(
+            api_key,
+            base_url,
+            timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            requests_per_minute=requests_per_minute,
+            cache_mode=cache_mode,
+            cache_path=cache_path,
+        )
+        self._httpx = httpx
+        # httpx adds Content-Type itself when a json body is passed.
+        self._http2 = httpx.Client(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Issue the raw HTTP call over the multiplexed connection."""
+        try:
+            return self._http2.request(
+                method,
+                path,
+                json=json,
+                params=params,
+                headers=headers,
+            )
+        except self._httpx.TimeoutException:
+            raise PrimisTimeoutError(f"Request to {path} timed out")
+        except self._httpx.ConnectError as e:
+            raise PrimisError(f"Connection error: {e}", "CONNECTION_ERROR")
+
+    def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        read_timeout: Optional[float] = None,
+    ) -> Any:
+        """Open a streaming GET over the multiplexed connection.
+
+        Mirrors HttpClient.stream so SSE consumers ride the same
+        transport as every other call instead of falling back to the
+        unused requests session.
+        """
+        timeout = self._httpx.Timeout(self.timeout, read=read_timeout)
+        request = self._http2.build_request("GET", path, params=params, timeout=timeout)
+        try:
+            return self._http2.send(request, stream=True)
+        except self._httpx.TimeoutException:
+            raise PrimisTimeoutError(f"Request to {path} timed out")
+        except self._httpx.ConnectError as e:
+            raise PrimisError(f"Connection error: {e}", "CONNECTION_ERROR")
+
+
 # Resource Classes
 class FilesResource:
     """Files API - Upload, list, and manage files."""
@@ -179,10 +627,12 @@ class FilesResource:
 
 class ImagesResource:
     """Images API - Generate images using SDXL."""
-    
-    def __init__(self, client: HttpClient):
+
+    def __init__(self, client: HttpClient, estimate_cache_ttl: float = 300.0):
         self._client = client
-    
+        self._estimate_cache_ttl = estimate_cache_ttl
+        self._estimate_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
     def estimate(
         self,
         prompt: str,
@@ -193,24 +643,43 @@ class ImagesResource:
     ) -> Dict[str, Any]:
         """
         Estimate the cost of generating images.
-        
+
+        Estimates are deterministic server-side, so repeat queries (e.g.
+        a UI debouncing a slider) are served from a small LRU memo
+        instead of the network.
+
         Args:
             prompt: The prompt describing the image
             num_images: Number of images to generate (1-10)
             width: Image width in pixels
             height: Image height in pixels
             steps: Number of inference steps
-        
+
         Returns:
             Dict with estimatedCost, estimatedTime, and gpuType
         """
-        return self._client.post("/api/batch/estimate", {
+        key = (prompt, num_images, width, height, steps)
+        cached = self._estimate_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._estimate_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+        result = self._client.post("/api/batch/estimate", {
             "prompt": prompt,
             "numImages": num_images,
             "width": width,
             "height": height,
             "steps": steps,
         })
+
+        self._estimate_cache[key] = (
+            time.monotonic() + self._estimate_cache_ttl,
+            copy.deepcopy(result),
+        )
+        self._estimate_cache.move_to_end(key)
+        while len(self._estimate_cache) > _ESTIMATE_CACHE_SIZE:
+            self._estimate_cache.popitem(last=False)
+        return result
     
     def generate(
         self,
@@ -259,15 +728,98 @@ class ImagesResource:
         response = self._client.post("/api/batch/generate", payload)
         return response.get("job", response)
     
+    def generate_many(
+        self,
+        prompts: List[str],
+        negative_prompt: Optional[str] = None,
+        width: int = 1024,
+        height: int = 1024,
+        steps: int = 30,
+        guidance_scale: float = 7.5,
+        seed: Optional[int] = None,
+        max_batch: int = 10,
+    ) -> List[ImageJob]:
+        """
+        Generate images for several prompts, coalesced into batch calls.
+
+        Prompts sharing the same parameters ride a single
+        ``/api/batch/generate`` POST (up to ``max_batch`` per request),
+        so N prompts cost ceil(N / max_batch) round-trips and rate-limit
+        tokens instead of N. Job order matches the input prompt order.
+
+        Args:
+            prompts: Prompts, one per desired job
+            negative_prompt: What to avoid in the images
+            width: Image width in pixels
+            height: Image height in pixels
+            steps: Number of inference steps
+            guidance_scale: How closely to follow the prompt
+            seed: Random seed for reproducibility
+            max_batch: Max prompts per API call (default: 10, API limit)
+
+        Returns:
+            List of ImageJob dicts, one per prompt, in input order
+
+        Example:
+            >>> jobs = client.images.generate_many(["A cat", "A dog"])
+            >>> results = [client.images.wait_for_job(j["id"]) for j in jobs]
+        """
+        jobs: List[ImageJob] = []
+
+        for start in range(0, len(prompts), max_batch):
+            chunk = prompts[start:start + max_batch]
+            payload: Dict[str, Any] = {
+                "prompts": chunk,
+                "width": width,
+                "height": height,
+                "steps": steps,
+                "guidanceScale": guidance_scale,
+            }
+            if negative_prompt:
+                payload["negativePrompt"] = negative_prompt
+            if seed is not None:
+                payload["seed"] = seed
+
+            response = self._client.post("/api/batch/generate", payload)
+            batch_jobs = response.get("jobs")
+            if batch_jobs is None:
+                # Server returned a single job for the whole batch.
+                batch_jobs = [response.get("job", response)]
+            jobs.extend(batch_jobs)
+
+        return jobs
+
     def get_job(self, job_id: str) -> ImageJob:
         """Get the status of an image generation job."""
         response = self._client.get(f"/api/batch/jobs/{job_id}")
         return response.get("job", response)
     
-    def list_jobs(self) -> List[ImageJob]:
-        """List all image generation jobs."""
+    def list_jobs(self, include: Optional[List[str]] = None) -> List[ImageJob]:
+        """
+        List all image generation jobs.
+
+        Args:
+            include: Optional enrichments; pass ["images"] to replace
+                each completed job with its full get_job payload. The
+                follow-up fetches run on a thread pool over the shared
+                connection pool, so N jobs cost roughly one round-trip
+                wave instead of N sequential ones.
+
+        Returns:
+            List of ImageJob dicts
+        """
         response = self._client.get("/api/batch/jobs")
-        return response.get("jobs", [])
+        jobs = response.get("jobs", [])
+
+        if include and "images" in include:
+            completed = [j["id"] for j in jobs if j.get("status") == "completed"]
+            if completed:
+                with ThreadPoolExecutor(max_workers=min(16, len(completed))) as ex:
+                    enriched = list(ex.map(self.get_job, completed))
+                by_id = {j["id"]: j for j in enriched if j.get("id")}
+                jobs = [by_id.get(j.get("id"), j) for j in jobs]
+
+        return jobs
     
     def wait_for_job(
         self,
@@ -278,53 +830,171 @@ class ImagesResource:
         """
         Wait for a job to complete (polling).
         
+        Polling starts at ``poll_interval`` and backs off exponentially
+        (capped at 15s, with jitter) so long-running jobs cost far fewer
+        API calls than a fixed-interval loop.
+
         Args:
             job_id: The ID of the job to wait for
-            poll_interval: Seconds between status checks
+            poll_interval: Initial seconds between status checks
             max_wait: Maximum seconds to wait before timing out
-        
+
         Returns:
             The completed ImageJob
-        
+
         Raises:
             PrimisTimeoutError: If the job doesn't complete in time
-        
+
         Example:
             >>> job = client.images.generate(prompt="A cat")
             >>> result = client.images.wait_for_job(job["id"])
             >>> print(result["images"])
         """
         start_time = time.time()
-        
+        interval = poll_interval
+
         while time.time() - start_time < max_wait:
             job = self.get_job(job_id)
-            
+
             if job["status"] in ("completed", "failed"):
                 return job
-            
-            time.sleep(poll_interval)
-        
+
+            # Honor an explicit server hint when present, otherwise back
+            # off exponentially with jitter to avoid thundering herds.
+            retry_after = job.get("retryAfter")
+            if retry_after is not None:
+                try:
+                    sleep_for = max(float(retry_after), 0.0)
+                except (TypeError, ValueError):
+                    sleep_for = interval
+            else:
+                sleep_for = interval + random.uniform(0, 0.25 * interval)
+                interval = min(interval * 1.5, 15.0)
+
+            # Never sleep past the max_wait budget, whatever the server
+            # hinted; the loop condition settles the timeout.
+            sleep_for = min(sleep_for, max(max_wait - (time.time() - start_time), 0.0))
+            time.sleep(sleep_for)
+
+        raise PrimisTimeoutError(f"Job {job_id} timed out after {max_wait}s")
+
+    def wait_for_job_stream(
+        self,
+        job_id: str,
+        max_wait: float = 300.0,
+    ) -> ImageJob:
+        """
+        Wait for a job to complete over a single server-sent event stream.
+
+        Opens one streaming GET to ``/api/batch/jobs/{id}/events`` and
+        reads status pushes until the job reaches a terminal state —
+        one connection instead of dozens of polling round-trips. Falls
+        back to :meth:`wait_for_job` if the server doesn't expose the
+        stream endpoint.
+
+        Args:
+            job_id: The ID of the job to wait for
+            max_wait: Maximum seconds to wait before timing out
+
+        Returns:
+            The completed ImageJob
+
+        Raises:
+            PrimisTimeoutError: If the job doesn't complete in time
+        """
+        events_path = f"/api/batch/jobs/{job_id}/events"
+        response = self._client.stream(events_path, read_timeout=max_wait)
+
+        if response.status_code in (404, 405):
+            response.close()
+            return self.wait_for_job(job_id, max_wait=max_wait)
+
+        if response.status_code >= 400:
+            # Auth/rate-limit/server errors must surface as themselves,
+            # not be consumed below as non-SSE lines.
+            try:
+                read = getattr(response, "read", None)
+                if callable(read):
+                    read()  # httpx streamed bodies must be read before .content
+                self._client._handle_response(response, events_path)
+            finally:
+                response.close()
+
+        # The stream may come from either transport: requests yields
+        # bytes and reports mid-stream read timeouts as ConnectionError,
+        # httpx yields str and raises its own exception types.
+        timeout_errors: Tuple[Any, ...] = (requests.Timeout,)
+        network_errors: Tuple[Any, ...] = (requests.ConnectionError,)
+        httpx_mod = getattr(self._client, "_httpx", None)
+        if httpx_mod is not None:
+            timeout_errors += (httpx_mod.TimeoutException,)
+            network_errors += (httpx_mod.TransportError,)
+
+        start_time = time.time()
+        try:
+            for raw in response.iter_lines():
+                line = raw.decode("utf-8", "replace") if isinstance(raw, bytes) else raw
+                if time.time() - start_time > max_wait:
+                    break
+                if not line or not line.startswith("data: "):
+                    continue
+                try:
+                    job = _json.loads(line[len("data: "):])
+                except ValueError:
+                    continue
+                if job.get("status") in ("completed", "failed"):
+                    return job
+        except timeout_errors:
+            pass
+        except network_errors as e:
+            # Within the budget it's a real drop, not a stalled read.
+            if time.time() - start_time < max_wait:
+                raise PrimisError(f"Connection error: {e}", "CONNECTION_ERROR")
+        finally:
+            response.close()
+
         raise PrimisTimeoutError(f"Job {job_id} timed out after {max_wait}s")
 
 
 class TextResource:
     """Text API - Generate text using Llama models."""
-    
-    def __init__(self, client: HttpClient):
+
+    def __init__(self, client: HttpClient, estimate_cache_ttl: float = 300.0):
         self._client = client
-    
+        self._estimate_cache_ttl = estimate_cache_ttl
+        self._estimate_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
     def estimate(
         self,
         prompt: str,
         max_tokens: int = 512,
         model: str = "llama8b",
     ) -> Dict[str, Any]:
-        """Estimate the cost of text generation."""
-        return self._client.post("/api/inference/text/estimate", {
+        """Estimate the cost of text generation.
+
+        Repeat queries are served from a small LRU memo; see
+        ImagesResource.estimate.
+        """
+        key = (prompt, max_tokens, model)
+        cached = self._estimate_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._estimate_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+        result = self._client.post("/api/inference/text/estimate", {
             "prompt": prompt,
             "maxTokens": max_tokens,
             "model": model,
         })
+
+        self._estimate_cache[key] = (
+            time.monotonic() + self._estimate_cache_ttl,
+            copy.deepcopy(result),
+        )
+        self._estimate_cache.move_to_end(key)
+        while len(self._estimate_cache) > _ESTIMATE_CACHE_SIZE:
+            self._estimate_cache.popitem(last=False)
+        return result
     
     def generate(
         self,
@@ -433,6 +1103,25 @@ class Primis:
         api_key: Your Primis API key (starts with 'prmis_')
         base_url: API base URL (default: http://localhost:3001)
         timeout: Request timeout in seconds (default: 30)
+        pool_connections: Number of connection pools to keep (default: 10)
+        pool_maxsize: Max keep-alive connections per pool (default: 50)
+        max_retries: Transport-level retries for idempotent requests (default: 3)
+        cache_ttl: Override TTL in seconds for the GET response cache
+            (default: per-endpoint policy)
+        http2: Use an HTTP/2 multiplexed connection via httpx; needs the
+            'http2' extra installed (default: False)
+        requests_per_minute: Client-side rate limit smoothing bursts
+            before they hit the server (default: 600; 0 disables)
+        cache_mode: Persistent response cache policy: 'enabled',
+            'readonly', 'replay', 'writeonly', or 'disabled' (default)
+        cache_path: SQLite file for the persistent cache
+            (default: ~/.primis/cache.db)
+        estimate_cache_ttl: Seconds to memoize estimate results
+            (default: 300)
+        warmup: Prime a pooled connection with a background HEAD at
+            construction so the first real call skips the TLS handshake
+            (default: True; best-effort, unauthenticated, skipped in
+            replay cache mode which promises no network)
     
     Example:
         >>> from primis import Primis
@@ -452,17 +1141,52 @@ class Primis:
         api_key: str,
         base_url: str = "http://localhost:3001",
         timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 50,
+        max_retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        http2: bool = False,
+        requests_per_minute: int = 600,
+        cache_mode: str = "disabled",
+        cache_path: Optional[str] = None,
+        estimate_cache_ttl: float = 300.0,
+        warmup: bool = True,
     ):
-        self._client = HttpClient(api_key, base_url, timeout)
+        client_cls = Http2Client if http2 else HttpClient
+        self._client = client_cls(
+            api_key,
+            base_url,
+            timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            requests_per_minute=requests_per_minute,
+            cache_mode=cache_mode,
+            cache_path=cache_path,
+        )
         
         # Resource namespaces
         self.files = FilesResource(self._client)
-        self.images = ImagesResource(self._client)
-        self.text = TextResource(self._client)
+        self.images = ImagesResource(self._client, estimate_cache_ttl=estimate_cache_ttl)
+        self.text = TextResource(self._client, estimate_cache_ttl=estimate_cache_ttl)
         self.instances = InstancesResource(self._client)
         self.api_keys = ApiKeysResource(self._client)
-    
+
+        # Replay mode promises no network at all, probes included.
+        if warmup and cache_mode != "replay":
+            self._client.warmup()
+
     @property
     def base_url(self) -> str:
         """Get the API base URL."""
         return self._client.base_url
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses so the next calls hit the API."""
+        self._client.clear_cache()
+
+    def refresh_estimates(self) -> None:
+        """Drop memoized estimate results (e.g. after a pricing change)."""
+        self.images._estimate_cache.clear()
+        self.text._estimate_cache.clear()
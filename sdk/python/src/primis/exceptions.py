@@ -3,7 +3,7 @@
 
 class PrimisError(Exception):
     """Base exception for all Primis SDK errors."""
-    
+
     def __init__(self, message: str, code: str = "UNKNOWN"):
         self.message = message
         self.code = code
@@ -12,7 +12,7 @@ class PrimisError(Exception):
 
 class PrimisAPIError(PrimisError):
     """Exception raised when the API returns an error response."""
-    
+
     def __init__(self, message: str, code: str, status_code: int):
         self.status_code = status_code
         super().__init__(message, code)
@@ -23,21 +23,21 @@ class PrimisAPIError(PrimisError):
 
 class PrimisTimeoutError(PrimisError):
     """Exception raised when a request or job times out."""
-    
+
     def __init__(self, message: str = "Request timed out"):
         super().__init__(message, "TIMEOUT")
 
 
 class PrimisAuthError(PrimisAPIError):
     """Exception raised for authentication errors."""
-    
+
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(message, "AUTH_ERROR", 401)
 
 
 class PrimisRateLimitError(PrimisAPIError):
     """Exception raised when rate limit is exceeded."""
-    
+
     def __init__(self, message: str, retry_after: int = 60):
         self.retry_after = retry_after
         super().__init__(message, "RATE_LIMIT_EXCEEDED", 429)